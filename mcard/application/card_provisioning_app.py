@@ -304,7 +304,7 @@ class CardProvisioningApp:
         Returns:
             List of MCard instances
         """
-        cards, _ = await self.store.list(page_size=limit, page=(offset // limit + 1) if limit and offset else None)
+        cards, _ = await self.store.list(limit=limit, offset=offset)
         return cards
 
     async def list_provisioned_cards(self, limit: Optional[int] = None, offset: Optional[int] = None) -> List[MCard]:
@@ -333,7 +333,10 @@ class CardProvisioningApp:
         if content is None:
             return await self.list_provisioned_cards(limit=limit, offset=offset)
             
-        return await self.store.list(content=content, limit=limit, offset=offset)
+        # Let the store apply the filter as ``content LIKE ?`` instead of
+        # materializing every card and filtering in Python.
+        cards, _ = await self.store.list(content=content, limit=limit, offset=offset)
+        return cards
 
     async def decommission_card(self, hash_str: str) -> None:
         """Decommission (delete) a card by its hash.
@@ -4,9 +4,22 @@ Content type detection and validation service.
 import json
 import mimetypes
 import xml.etree.ElementTree as ET
-from typing import Any, Dict, Tuple, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 from ...domain.models.exceptions import ValidationError
 
+
+# Bytes above 0x7F, deleted via bytes.translate to count non-ASCII bytes in C
+_NON_ASCII_BYTES = bytes(range(0x80, 0x100))
+
+
+def _index_signatures(signatures: Dict[bytes, str]) -> Dict[bytes, List[Tuple[bytes, str]]]:
+    """Group signatures by their first byte, keeping their original order."""
+    index: Dict[bytes, List[Tuple[bytes, str]]] = {}
+    for signature, mime_type in signatures.items():
+        index.setdefault(signature[:1], []).append((signature, mime_type))
+    return index
+
+
 class ContentTypeInterpreter:
     """Service for content type detection and validation."""
 
@@ -46,6 +59,10 @@ class ContentTypeInterpreter:
         b'PAR1': 'application/x-parquet',  # Parquet files
     }
 
+    # Signatures keyed by lead byte, so content is only compared against
+    # the few formats that can possibly match
+    _SIGNATURES_BY_LEAD_BYTE = _index_signatures(SIGNATURES)
+
     # Text-based MIME types
     TEXT_MIME_TYPES = {
         # Basic text formats
@@ -81,13 +98,21 @@ class ContentTypeInterpreter:
         'application/x-yaml',
     }
 
+    @staticmethod
+    def _match_signature(content: bytes) -> Optional[str]:
+        """Return the MIME type of the first signature content starts with."""
+        for signature, mime_type in ContentTypeInterpreter._SIGNATURES_BY_LEAD_BYTE.get(content[:1], ()):
+            if content.startswith(signature):
+                return mime_type
+        return None
+
     @staticmethod
     def _detect_by_signature(content: bytes) -> str:
         """Detect MIME type using file signatures."""
         # Check for known file signatures
-        for signature, mime_type in ContentTypeInterpreter.SIGNATURES.items():
-            if content.startswith(signature):
-                return mime_type
+        mime_type = ContentTypeInterpreter._match_signature(content)
+        if mime_type is not None:
+            return mime_type
         
         # Check for XML signature
         if content.startswith(b'<?xml') or content.lstrip(b' \t\n\r').startswith(b'<'):
@@ -170,9 +195,9 @@ class ContentTypeInterpreter:
                     pass
 
             # Then check for binary signatures at the start
-            for signature, mime_type in ContentTypeInterpreter.SIGNATURES.items():
-                if content.startswith(signature):
-                    return mime_type, ContentTypeInterpreter.get_extension(mime_type)
+            mime_type = ContentTypeInterpreter._match_signature(content)
+            if mime_type is not None:
+                return mime_type, ContentTypeInterpreter.get_extension(mime_type)
 
             # If no specific binary format detected, check for text formats
             try:
@@ -306,6 +331,7 @@ class ContentTypeInterpreter:
         This method uses multiple heuristics:
         1. If content is already a string, it's not binary
         2. For bytes content:
+           - Check the first 1024 bytes for null bytes
            - Check for known binary signatures
            - Try UTF-8 decoding
            - Analyze content patterns
@@ -316,6 +342,12 @@ class ContentTypeInterpreter:
         if not isinstance(content, (bytes, bytearray)):
             raise ValidationError("Content must be string or bytes")
 
+        # Null bytes in the first 1024 bytes mark binary content; no text
+        # signature (XML, JSON) can contain them, so skip parsing entirely
+        sample = content[:1024]
+        if b'\x00' in sample:
+            return True
+
         # Check for known binary signatures
         mime_type = ContentTypeInterpreter._detect_by_signature(content)
         if mime_type != 'application/octet-stream':
@@ -325,16 +357,14 @@ class ContentTypeInterpreter:
         try:
             content.decode('utf-8')
             # Check for binary patterns
-            # Look at first 1024 bytes for null bytes or high number of non-ASCII chars
-            sample = content[:1024]
+            # Look at first 1024 bytes for a high number of non-ASCII chars
             if not sample:  # Handle empty content
                 return False
-                
-            null_count = sample.count(b'\x00')
-            non_ascii = sum(1 for b in sample if b > 0x7F)
-            
-            # If more than 30% non-ASCII or contains null bytes, likely binary
-            return (null_count > 0) or (non_ascii / len(sample) > 0.3)
+
+            non_ascii = len(sample) - len(sample.translate(None, _NON_ASCII_BYTES))
+
+            # If more than 30% non-ASCII, likely binary
+            return non_ascii / len(sample) > 0.3
         except UnicodeDecodeError:
             return True
 
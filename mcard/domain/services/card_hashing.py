@@ -1,10 +1,9 @@
 """Card hashing service."""
 import asyncio
 from typing import Optional
-import hashlib
 
 from ..models.hashing_protocol import HashingService
-from .hashing import get_hashing_service
+from .hashing import get_hashing_service, hash_constructor
 
 def compute_hash(content: bytes) -> str:
     """Compute hash for content using the configured hashing service."""
@@ -14,6 +13,4 @@ def compute_hash(content: bytes) -> str:
     algorithm = hashing_service.settings.algorithm
 
     # Use hashlib directly
-    hasher = hashlib.new(algorithm)
-    hasher.update(content)
-    return hasher.hexdigest()
+    return hash_constructor(algorithm)(content).hexdigest()
@@ -4,6 +4,7 @@ Comprehensive hashing service implementation.
 import hashlib
 import importlib
 from dataclasses import dataclass, field
+from functools import lru_cache, partial
 from typing import Optional, Union, Callable, Any, Dict
 import logging
 
@@ -16,6 +17,24 @@ class HashingError(Exception):
     """Raised when hashing operations fail."""
     pass
 
+@lru_cache(maxsize=None)
+def hash_constructor(algorithm: str) -> Callable[..., Any]:
+    """
+    Get the hashlib constructor for an algorithm.
+
+    Guaranteed algorithms bind their named constructor (e.g. ``hashlib.sha256``),
+    which skips the name lookup ``hashlib.new`` performs on every call.
+
+    Args:
+        algorithm: Name of a hashlib algorithm
+
+    Returns:
+        Callable taking the data to hash and returning a hash object
+    """
+    if algorithm in hashlib.algorithms_guaranteed:
+        return getattr(hashlib, algorithm)
+    return partial(hashlib.new, algorithm)
+
 class DefaultHashingService(HashingServiceProtocol):
     """
     Default implementation of HashingService.
@@ -84,10 +103,9 @@ class DefaultHashingService(HashingServiceProtocol):
                 raise HashingError(f"Failed to load custom hash function: {str(e)}")
 
         if settings.algorithm in hashlib.algorithms_available:
+            constructor = hash_constructor(settings.algorithm)
             def hash_func(content: bytes) -> str:
-                hasher = hashlib.new(settings.algorithm)
-                hasher.update(content)
-                return hasher.hexdigest()
+                return constructor(content).hexdigest()
             return hash_func
 
         raise HashingError(f"Unsupported hashing algorithm: {settings.algorithm}")
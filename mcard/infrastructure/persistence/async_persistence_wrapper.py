@@ -77,6 +77,8 @@ class AsyncPersistenceWrapper(CardStore):
         g_time_search: Optional[str] = None,
         page: Optional[int] = None,
         page_size: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
     ) -> Tuple[List[MCard], Optional[Dict]]:
         """List cards with optional filtering and pagination.
         
@@ -88,6 +90,8 @@ class AsyncPersistenceWrapper(CardStore):
             g_time_search: Optional g_time text search
             page: Optional page number (1-based)
             page_size: Optional page size
+            limit: Optional maximum number of cards, used when no page is given
+            offset: Optional number of cards to skip, used when no page is given
             
         Returns:
             Tuple of (list of cards, pagination info dict)
@@ -101,6 +105,8 @@ class AsyncPersistenceWrapper(CardStore):
             g_time_search=g_time_search,
             page=page,
             page_size=page_size,
+            limit=limit,
+            offset=offset,
         )
 
     async def search(
@@ -1,8 +1,14 @@
 """Database engine configuration module."""
+import re
 from dataclasses import dataclass, field
 from typing import Optional, Dict, Any
 from enum import Enum
 
+# PRAGMA statements can't take bound parameters, so names and values are checked
+# before the engine formats them into SQL
+_PRAGMA_NAME = re.compile(r'[a-z_]+')
+_PRAGMA_VALUE = re.compile(r'-?\d+|[A-Za-z_]+')
+
 
 class EngineType(Enum):
     """Supported database engine types."""
@@ -53,6 +59,11 @@ class EngineConfig:
         check_same_thread = self.engine_options.get('check_same_thread')
         if check_same_thread is not None and not isinstance(check_same_thread, bool):
             raise ValueError("check_same_thread must be a boolean")
+        for name, value in self.engine_options.get('pragmas', {}).items():
+            if not _PRAGMA_NAME.fullmatch(str(name)):
+                raise ValueError(f"Invalid PRAGMA name: {name!r}")
+            if not _PRAGMA_VALUE.fullmatch(str(value)):
+                raise ValueError(f"Invalid value for PRAGMA {name}: {value!r}")
 
     def create_store(self):
         """Create a store instance based on the engine type."""
@@ -71,15 +82,28 @@ class SQLiteConfig(EngineConfig):
                  max_connections: Optional[int] = 5,
                  timeout: Optional[float] = 5.0,
                  check_same_thread: Optional[bool] = False,
-                 max_content_size: Optional[int] = 5 * 1024 * 1024):
-        """Initialize SQLite configuration."""
+                 max_content_size: Optional[int] = 5 * 1024 * 1024,
+                 uri: Optional[bool] = False,
+                 pragmas: Optional[Dict[str, Any]] = None):
+        """Initialize SQLite configuration.
+
+        Set ``uri`` to open ``db_path`` as an SQLite URI, e.g.
+        ``file:name?mode=memory&cache=shared`` for a named in-memory database.
+        ``pragmas`` maps PRAGMA names to values applied on every new
+        connection after the defaults, e.g. ``{'synchronous': 'OFF'}``.
+        """
+        engine_options = {'check_same_thread': check_same_thread}
+        if uri:
+            engine_options['uri'] = True
+        if pragmas:
+            engine_options['pragmas'] = dict(pragmas)
         super().__init__(
             engine_type=EngineType.SQLITE,
             connection_string=db_path,
             max_connections=max_connections,
             timeout=timeout,
             max_content_size=max_content_size,
-            engine_options={'check_same_thread': check_same_thread}
+            engine_options=engine_options
         )
 
     @property
@@ -92,6 +116,29 @@ class SQLiteConfig(EngineConfig):
         """Get the check_same_thread setting."""
         return self.engine_options.get('check_same_thread', False)
 
+    @property
+    def uri(self) -> bool:
+        """Get whether db_path is an SQLite URI."""
+        return self.engine_options.get('uri', False)
+
+    @property
+    def pragmas(self) -> Dict[str, Any]:
+        """Get the extra PRAGMAs applied on connect."""
+        return self.engine_options.get('pragmas', {})
+
+    @property
+    def is_memory(self) -> bool:
+        """Check whether the database lives in memory rather than on disk."""
+        if self.db_path == ':memory:':
+            return True
+        if not self.uri:
+            return False
+        # Both file::memory:?cache=shared and file:name?mode=memory are in memory
+        path, _, query = self.db_path.partition('?')
+        if path.startswith('file:'):
+            path = path[len('file:'):]
+        return path == ':memory:' or 'mode=memory' in query.split('&')
+
 
 # Factory function to create appropriate config
 def create_engine_config(engine_type: EngineType, **kwargs) -> EngineConfig:
@@ -102,13 +149,17 @@ def create_engine_config(engine_type: EngineType, **kwargs) -> EngineConfig:
         timeout = kwargs.get('timeout', 5.0)
         max_content_size = kwargs.get('max_content_size', 5 * 1024 * 1024)
         check_same_thread = kwargs.get('engine_options', {}).get('check_same_thread', False)
+        uri = kwargs.get('engine_options', {}).get('uri', False)
+        pragmas = kwargs.get('engine_options', {}).get('pragmas')
         
         return SQLiteConfig(
             db_path=db_path,
             max_connections=max_connections,
             timeout=timeout,
             check_same_thread=check_same_thread,
-            max_content_size=max_content_size
+            max_content_size=max_content_size,
+            uri=uri,
+            pragmas=pragmas
         )
     else:
         raise ValueError(f"Unsupported engine type: {engine_type}")
@@ -18,6 +18,15 @@ from mcard.infrastructure.persistence.engine.base_engine import BaseStore
 
 logger = logging.getLogger(__name__)
 
+# Rows per multi-row INSERT: three bound columns each, kept under SQLite's
+# historical 999 host-parameter limit
+SAVE_MANY_BATCH_ROWS = 999 // 3
+
+
+def _insert_cards_sql(rows: int) -> str:
+    """Build an INSERT statement for ``rows`` cards in one VALUES list."""
+    return 'INSERT INTO card (hash, content, g_time) VALUES ' + ', '.join(['(?, ?, ?)'] * rows)
+
 
 class SQLiteStore(BaseStore):
     """SQLite store implementation."""
@@ -42,26 +51,18 @@ class SQLiteStore(BaseStore):
         """Initialize the database connection."""
         if not self._initialized:
             logger.debug(f'Initializing SQLite database at {self._config.db_path}')  # Log initialization
-            # Ensure the database directory exists
-            db_path = Path(self._config.db_path)
-            db_path.parent.mkdir(parents=True, exist_ok=True)
-
-            # Create the database file if it does not exist
-            if not db_path.exists():
-                logger.debug(f'Creating database file at {db_path}')  # Log file creation
-                open(db_path, 'a').close()  # Create an empty file if it doesn't exist
-
-            # Open connection
-            self._connection = await aiosqlite.connect(
-                self._config.db_path,
-                timeout=self._config.timeout
-            )
-            
-            # Configure connection
-            await self._connection.execute('PRAGMA journal_mode=WAL')
-            await self._connection.execute('PRAGMA synchronous=NORMAL')
-            await self._connection.execute('PRAGMA foreign_keys=ON')
-            await self._connection.execute(f'PRAGMA busy_timeout={self._busy_timeout}')
+            # In-memory databases have no file to prepare
+            if not self._config.is_memory:
+                # Ensure the database directory exists
+                db_path = Path(self._config.db_path)
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+
+                # Create the database file if it does not exist
+                if not db_path.exists():
+                    logger.debug(f'Creating database file at {db_path}')  # Log file creation
+                    open(db_path, 'a').close()  # Create an empty file if it doesn't exist
+
+            await self._connect()
             
             # Initialize schema using SchemaManager
             await self._schema_manager.initialize_schema(EngineType.SQLITE, self._connection)
@@ -69,6 +70,48 @@ class SQLiteStore(BaseStore):
             await self._connection.commit()
             self._initialized = True
 
+    async def initialize_from(self, template: 'SQLiteStore'):
+        """Initialize the database as a copy of another store's database.
+
+        Pages are copied with SQLite's online backup API, so the schema DDL is
+        not re-executed. Used to spin up fresh in-memory stores cheaply.
+        """
+        if not self._initialized:
+            if not template._initialized:
+                await template.initialize()
+            logger.debug(f'Copying SQLite database from {template._config.db_path} to {self._config.db_path}')
+            await self._connect()
+            await template._connection.backup(self._connection)
+            self._initialized = True
+
+    async def restore_from(self, snapshot: 'SQLiteStore'):
+        """Overwrite the live database with the contents of a snapshot store.
+
+        The snapshot's pages are copied over the open connection with the
+        backup API, so the store is reset without reconnecting or re-running
+        the schema DDL.
+        """
+        if not self._initialized:
+            await self.initialize()
+        logger.debug(f'Restoring SQLite database at {self._config.db_path} from {snapshot._config.db_path}')
+        await snapshot._connection.backup(self._connection)
+
+    async def _connect(self):
+        """Open and configure the database connection."""
+        self._connection = await aiosqlite.connect(
+            self._config.db_path,
+            timeout=self._config.timeout,
+            uri=self._config.uri
+        )
+        
+        # Configure connection
+        await self._connection.execute('PRAGMA journal_mode=WAL')
+        await self._connection.execute('PRAGMA synchronous=NORMAL')
+        await self._connection.execute('PRAGMA foreign_keys=ON')
+        await self._connection.execute(f'PRAGMA busy_timeout={self._busy_timeout}')
+        for name, value in self._config.pragmas.items():
+            await self._connection.execute(f'PRAGMA {name}={value}')
+
     async def close(self):
         """Close the database connection."""
         if self._initialized and self._connection:
@@ -212,6 +255,8 @@ class SQLiteStore(BaseStore):
         g_time_search: Optional[str] = None,
         page: Optional[int] = None,
         page_size: Optional[int] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
     ) -> Tuple[List[MCard], Optional[Dict]]:
         """List cards with optional filtering and pagination.
         
@@ -223,6 +268,8 @@ class SQLiteStore(BaseStore):
             g_time_search: Optional g_time text search
             page: Optional page number (1-based)
             page_size: Optional page size
+            limit: Optional maximum number of cards, used when no page is given
+            offset: Optional number of cards to skip, used when no page is given
             
         Returns:
             Tuple of (list of cards, pagination info dict)
@@ -239,9 +286,9 @@ class SQLiteStore(BaseStore):
                 raise ValidationError("Page size must be >= 1")
             offset = (page - 1) * page_size
             limit = page_size
-        else:
-            offset = None
-            limit = None
+        elif offset is not None and limit is None:
+            # SQLite only accepts OFFSET after a LIMIT; -1 means no limit
+            limit = -1
 
         async def _list():
             cursor = await self._connection.cursor()
@@ -265,7 +312,7 @@ class SQLiteStore(BaseStore):
                     query.append('AND g_time LIKE ?')
                     params.append(f'%{g_time_search}%')
 
-                query.append('ORDER BY g_time DESC')
+                query.append('ORDER BY g_time DESC, hash')
 
                 if limit is not None:
                     query.append('LIMIT ?')
@@ -366,7 +413,7 @@ class SQLiteStore(BaseStore):
                     SELECT hash, content, g_time 
                     FROM card 
                     WHERE {' OR '.join(query_parts)}
-                    ORDER BY g_time DESC
+                    ORDER BY g_time DESC, hash
                 '''
 
                 if limit is not None:
@@ -437,6 +484,49 @@ class SQLiteStore(BaseStore):
             logger.error(f'Failed to save card with hash: {card.hash}, error: {str(e)}')
             raise StorageError(f"Failed to save card: {str(e)}")
 
+    async def save_many(self, cards: List[MCard]) -> None:
+        """Save multiple cards in one transaction.
+
+        Cards are inserted with multi-row VALUES statements of up to
+        ``SAVE_MANY_BATCH_ROWS`` cards and committed once; if any insert fails
+        the transaction is rolled back, so either every card is saved or none is.
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        for card in cards:
+            if not card.content:
+                raise ValidationError("Content cannot be empty")
+            if len(str(card.content)) > self.max_content_size:
+                raise ValidationError(f"Content size exceeds maximum allowed size of {self.max_content_size} bytes")
+
+        if not cards:
+            return
+
+        async def _save_many():
+            logger.debug(f'Attempting to save {len(cards)} cards to database')
+            async with self._connection.cursor() as cursor:
+                try:
+                    for start in range(0, len(cards), SAVE_MANY_BATCH_ROWS):
+                        batch = cards[start:start + SAVE_MANY_BATCH_ROWS]
+                        params = []
+                        for card in batch:
+                            params.extend((card.hash, card.content, card.g_time))
+                        await cursor.execute(_insert_cards_sql(len(batch)), params)
+                    await self._connection.commit()
+                except Exception:
+                    # Discard rows inserted before the failure so a later
+                    # commit cannot persist a partial batch
+                    await self._connection.rollback()
+                    raise
+                logger.debug(f'Successfully saved {len(cards)} cards to database')
+
+        try:
+            await self._execute_with_retry(_save_many)
+        except Exception as e:
+            logger.error(f'Failed to save {len(cards)} cards, error: {str(e)}')
+            raise StorageError(f"Failed to save cards: {str(e)}")
+
     async def remove(self, hash_str: str) -> None:
         """Remove a card by its hash."""
         if not self._initialized:
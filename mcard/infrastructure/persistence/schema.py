@@ -11,7 +11,8 @@ The schema consists of:
   - g_time: TEXT - Global timestamp with timezone information
   - metadata: TEXT - JSON-encoded metadata associated with the card
 - An index on g_time for efficient time-based queries
-- An index on hash for efficient hash-based queries
+- A UNIQUE constraint on hash, whose implicit index serves hash-based
+  queries and rejects duplicate cards in a single lookup
 
 This single-table design was chosen to:
 1. Simplify database maintenance and backups
@@ -62,6 +63,7 @@ class TableDefinition:
     name: str
     columns: list[ColumnDefinition]
     indexes: Optional[Dict[str, list[str]]] = None  # index_name -> column_names
+    dropped_indexes: Optional[list[str]] = None  # Retired indexes removed from existing databases
     comment: Optional[str] = None
 
 
@@ -132,10 +134,12 @@ class SchemaManager:
                         comment="Global timestamp in ISO 8601 format with timezone and microsecond precision (e.g., '2023-12-25T13:45:30.123456+00:00')"
                     )
                 ],
+                # hash needs no explicit index: its UNIQUE constraint already
+                # creates one, and a second would be maintained on every insert
                 indexes={
-                    "idx_card_g_time": ["g_time"],
-                    "idx_card_hash": ["hash"]
+                    "idx_card_g_time": ["g_time"]
                 },
+                dropped_indexes=["idx_card_hash"],
                 comment="Single table storing all card data including content and timestamps"
             )
         }
@@ -223,6 +227,10 @@ class BaseSchemaHandler(ABC):
 
 class SQLiteSchemaHandler(BaseSchemaHandler):
     """SQLite-specific schema handler."""
+
+    def __init__(self):
+        """Initialize the handler with an empty DDL script cache."""
+        self._script_cache: Dict[str, str] = {}
     
     def get_column_type(self, column_type: ColumnType) -> str:
         """Map column types to SQLite types."""
@@ -284,6 +292,27 @@ class SQLiteSchemaHandler(BaseSchemaHandler):
         
         return table_sql, index_sqls
 
+    def _get_table_script(self, table: TableDefinition) -> str:
+        """
+        Get the DDL script for a table, generating it on first use.
+
+        The table, index and retired-index drop statements are joined into a
+        single script so they can be run with one executescript call.
+
+        Args:
+            table: Table definition containing columns and indexes
+
+        Returns:
+            SQL script creating the table and its indexes
+        """
+        script = self._script_cache.get(table.name)
+        if script is None:
+            table_sql, index_sqls = self._generate_table_sql(table)
+            drop_sqls = [f"DROP INDEX IF EXISTS {index_name}" for index_name in table.dropped_indexes or []]
+            script = ";\n".join([table_sql, *drop_sqls, *index_sqls.values()]) + ";"
+            self._script_cache[table.name] = script
+        return script
+
     async def initialize_schema(self, connection: Any, tables: Dict[str, TableDefinition]) -> None:
         """Initialize the SQLite schema."""
         try:
@@ -299,20 +328,14 @@ class SQLiteSchemaHandler(BaseSchemaHandler):
             for table_name, table_def in tables.items():
                 logger.debug(f"Processing table: {table_name}")
                 
-                # Generate table creation SQL
-                table_sql, index_sqls = self._generate_table_sql(table_def)
-                logger.debug(f"Table creation SQL: {table_sql}")
+                # Get the cached table and index creation script
+                script = self._get_table_script(table_def)
+                logger.debug(f"Table creation script: {script}")
                 
                 try:
-                    # Create table
-                    await connection.execute(table_sql)
+                    # Create table and indexes in one round trip
+                    await connection.executescript(script)
                     logger.info(f"Initialized table {table_name} in SQLite database")
-                    
-                    # Create indexes
-                    for index_name, index_sql in index_sqls.items():
-                        logger.debug(f"Index SQL: {index_sql}")
-                        await connection.execute(index_sql)
-                        logger.debug(f"Created index {index_name}")
                 
                 except sqlite3.OperationalError as e:
                     logger.error(f"Error initializing table {table_name}: {e}")
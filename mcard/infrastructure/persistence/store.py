@@ -30,7 +30,7 @@ class MCardStore:
     _lock = Lock()
     _initialized = False
 
-    def __new__(cls):
+    def __new__(cls, config: Optional[Dict[str, Any]] = None):
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
@@ -221,7 +221,7 @@ class MCardStore:
         for card in cards:
             if card.hash is None:
                 card.hash = self.compute_hash(card.content.encode('utf-8'))
-        await self._facade.save_many_cards(cards)
+        await self._facade.save_many(cards)
 
     def save_many_sync(self, cards: List[MCard]) -> None:
         """Save multiple cards synchronously."""
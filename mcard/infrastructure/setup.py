@@ -60,13 +60,30 @@ class MCardSetup:
             
         self.storage = AsyncPersistenceWrapper(engine_config)
         self.content_interpreter = ContentTypeInterpreter()
+        self._snapshot: Optional[SQLiteStore] = None
         
     async def initialize(self):
         """Initialize the storage system."""
         await self.storage.initialize()
+
+    async def snapshot(self):
+        """Copy the current database into an in-memory snapshot."""
+        if self._snapshot is not None:
+            await self._snapshot.close()
+        self._snapshot = SQLiteStore(SQLiteConfig(db_path=":memory:"))
+        await self._snapshot.initialize_from(self.storage.store)
+
+    async def reset_from_snapshot(self):
+        """Restore the database to the state captured by snapshot()."""
+        if self._snapshot is None:
+            raise StorageError("No snapshot has been taken")
+        await self.storage.store.restore_from(self._snapshot)
         
     async def cleanup(self):
         """Clean up resources."""
+        if self._snapshot is not None:
+            await self._snapshot.close()
+            self._snapshot = None
         await self.storage.close()
         
     async def __aenter__(self):
@@ -1,5 +1,6 @@
 """Configuration management for MCard API."""
 import os
+from functools import lru_cache
 from pathlib import Path
 from dotenv import load_dotenv
 from mcard.domain.models.domain_config_models import AppSettings, DatabaseSettings, HashingSettings
@@ -39,3 +40,12 @@ def load_config():
         mcard_api_key=os.getenv('MCARD_API_KEY', DEFAULT_API_KEY),
         mcard_api_port=int(os.getenv(ENV_API_PORT, DEFAULT_API_PORT))
     )
+
+@lru_cache(maxsize=None)
+def get_settings() -> AppSettings:
+    """Get the application settings, loading them on first use.
+
+    Call ``get_settings.cache_clear()`` after changing the environment to make
+    the next call re-read it.
+    """
+    return load_config()
@@ -2,12 +2,13 @@
 import os
 from typing import Optional
 from mcard.domain.models.domain_config_models import AppSettings
+from mcard.interfaces.api.api_config_loader import get_settings
 from fastapi import Header, HTTPException, Depends
 import logging
 
 logger = logging.getLogger(__name__)
 
-async def verify_api_key(x_api_key: Optional[str] = Header(None), settings: AppSettings = None):
+async def verify_api_key(x_api_key: Optional[str] = Header(None), settings: AppSettings = Depends(get_settings)):
     """Verify the API key from request headers.
     
     Args:
@@ -16,7 +16,7 @@ from mcard.infrastructure.persistence.database_engine_config import SQLiteConfig
 from mcard.application.card_provisioning_app import CardProvisioningApp
 from mcard.config_constants import ENV_SERVICE_LOG_LEVEL, ENV_DB_PATH, ENV_API_PORT, DEFAULT_API_PORT, DEFAULT_DB_PATH
 
-from mcard.interfaces.api.api_config_loader import load_config
+from mcard.interfaces.api.api_config_loader import get_settings
 from .auth import verify_api_key, get_api_key_header
 
 # Configure logging
@@ -48,7 +48,7 @@ class MCardAPI:
         """Get store instance lazily."""
         global _store
         if _store is None:
-            settings = load_config()
+            settings = get_settings()
             config = SQLiteConfig(
                 db_path=settings.database.db_path,
                 max_connections=settings.database.max_connections,
@@ -85,12 +85,27 @@ class MCardAPI:
             logger.error(f"Failed to get card: {e}")
             raise HTTPException(status_code=500, detail=str(e))
 
-    async def list_cards(self, page: int, page_size: int) -> List[MCard]:
-        """List cards with pagination."""
+    async def list_cards(
+        self,
+        page: Optional[int] = None,
+        page_size: Optional[int] = None,
+        content: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> List[MCard]:
+        """List cards with pagination and optional content filtering.
+
+        Paginate with either page/page_size or limit/offset, not both.
+        """
+        if (page is not None or page_size is not None) and (limit is not None or offset is not None):
+            raise ValueError("Pass page/page_size or limit/offset, not both")
         app = await self._init_app()
         # Convert page and page_size to limit and offset
-        offset = (page - 1) * page_size
-        limit = page_size
+        if page is not None and page_size is not None:
+            offset = (page - 1) * page_size
+            limit = page_size
+        if content:
+            return await app.list_cards_by_content(content=content, limit=limit, offset=offset)
         return await app.list_cards(limit=limit, offset=offset)
 
     async def remove_card(self, hash_str: str) -> None:
@@ -138,6 +153,9 @@ class MCardAPI:
             await _store.close()
             _store = None
             logger.info("API store closed and cleaned up")
+        # The provisioning app holds the closed store; rebuild it on next use
+        if hasattr(self, 'card_provisioning_app'):
+            del self.card_provisioning_app
 
 # Initialize API instance
 api = MCardAPI()
@@ -172,7 +190,7 @@ async def create_card(card: CardCreate, _=Depends(verify_api_key)):
 async def get_card(hash_str: str, _=Depends(verify_api_key)):
     """Get a card by hash."""
     result = await api.get_card(hash_str)
-    return CardResponse.from_mcard(result)
+    return result.to_api_response()
 
 @app.get("/cards", response_model=PaginatedCardsResponse)
 async def list_cards(
@@ -183,7 +201,7 @@ async def list_cards(
     """List cards with pagination."""
     cards = await api.list_cards(page, page_size)
     return PaginatedCardsResponse(
-        items=[CardResponse.from_mcard(card) for card in cards],
+        items=[card.to_api_response() for card in cards],
         total=len(cards),
         page=page,
         page_size=page_size
@@ -1,46 +1,37 @@
 import os
 import asyncio
+from pathlib import Path
 import logging
-from http import HTTPStatus
-from httpx import AsyncClient
-from mcard.interfaces.api.mcard_api import app, api
-from mcard.infrastructure.persistence.repositories import SQLiteCardRepo
-from mcard.infrastructure.persistence.schema import SchemaManager
-from mcard.infrastructure.persistence.database_engine_config import EngineType
-from mcard.domain.models.card import MCard, CardCreate
-from mcard.config_constants import TEST_DB_PATH
-from mcard.interfaces.api.api_config_loader import load_config
+from mcard.interfaces.api.mcard_api import api
+from mcard.config_constants import ENV_DB_PATH
+from mcard.interfaces.api.api_config_loader import get_settings
 import pytest
-import sqlite3
+import pytest_asyncio
 from datetime import datetime
 import aiosqlite
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
-# Load configuration
-config = load_config()
-DB_PATH = "./tests/data/test_mcard.db"  # Hardcoded path for testing
+# Hardcoded path for testing, made unique per xdist worker
+DB_PATH = f"./tests/data/test_mcard_{os.environ.get('PYTEST_XDIST_WORKER', 'gw0')}.db"
 
 # Ensure the database directory exists
 os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
 
-@pytest.fixture(scope="module")
-async def initialized_api():
+@pytest_asyncio.fixture
+async def initialized_api(monkeypatch):
     """Initialize the API and database."""
     # Ensure the database directory exists
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)  # Create the directory if it doesn't exist
     
-    # Initialize the store
+    # Point the API at DB_PATH, dropping any store opened with earlier settings
+    monkeypatch.setenv(ENV_DB_PATH, DB_PATH)
+    get_settings.cache_clear()
+    await api.shutdown()
+
+    # Initialize the store, which creates the schema
     store = await api.get_store()
-    await store.initialize()  # Make sure schema is initialized
-    
-    # Initialize the schema
-    conn = await aiosqlite.connect(DB_PATH)  # Create a new connection to the database
-    schema_manager = SchemaManager()  # Create an instance of SchemaManager
-    await schema_manager.initialize_schema(EngineType.SQLITE, conn)
-    await conn.close()
+    await store.initialize()
     
     try:
         yield api
@@ -50,94 +41,76 @@ async def initialized_api():
             await api.shutdown()
         except Exception as e:
             logger.error(f"Error during API shutdown: {e}")
-
-@pytest.fixture(autouse=True)
-async def cleanup_event_loop():
-    """Cleanup the event loop after each test."""
-    yield
-    try:
-        # Get all tasks except current
-        current_task = asyncio.current_task()
-        tasks = [t for t in asyncio.all_tasks() if t is not current_task]
-        
-        if tasks:
-            # Cancel all tasks
-            for task in tasks:
-                task.cancel()
-            
-            # Wait for all tasks to complete with a timeout
-            await asyncio.wait(tasks, timeout=5)
-            
-            # If any tasks are still pending, log them
-            pending = [t for t in tasks if not t.done()]
-            if pending:
-                logger.warning(f"Some tasks did not complete: {len(pending)} tasks remaining")
-    except Exception as e:
-        logger.error(f"Error during event loop cleanup: {e}")
+        get_settings.cache_clear()
+        for suffix in ("", "-wal", "-shm"):
+            Path(DB_PATH + suffix).unlink(missing_ok=True)
 
 @pytest.mark.asyncio
 async def test_mcard_api_persistent(initialized_api):
     """Test data persistence in the API."""
-    # Wait for the fixture to complete
-    test_api = await anext(initialized_api.__aiter__())
+    test_api = initialized_api
     
-    # Test content
+    # Test content; the index keeps each card unique, one timestamp is enough
+    timestamp = datetime.now().isoformat()
     test_contents = [
-        f"Persistent Test Card {i} - {datetime.now().isoformat()}"
+        f"Persistent Test Card {i} - {timestamp}"
         for i in range(1, 4)
     ]
     
     # Create cards directly using the API instance
-    created_hashes = []
     db = None
     try:
         # Create a single database connection for all operations
         db = await aiosqlite.connect(DB_PATH)
         
-        for content in test_contents:
+        async def create_or_reuse(content):
             # Check if the card already exists in the database
             async with db.execute("SELECT hash FROM card WHERE content = ?", (content,)) as cursor:
                 existing_card = await cursor.fetchone()
-                if existing_card:
-                    logger.debug(f"Card with content '{content}' already exists. Reusing existing card.")
-                    created_hashes.append(existing_card[0])  # Use the existing hash
-                else:
-                    # Create a new card if it doesn't exist
-                    card = await test_api.create_card(content)
-                    assert card is not None
-                    created_hashes.append(card.hash)
-                    logger.debug(f"Created new card with hash: {card.hash}")
-
-        # Verify cards were created and can be retrieved
-        for hash_str in created_hashes:
-            card = await test_api.get_card(hash_str)
+            if existing_card:
+                logger.debug(f"Card with content '{content}' already exists. Reusing existing card.")
+                return existing_card[0]  # Use the existing hash
+            # Create a new card if it doesn't exist
+            card = await test_api.create_card(content)
             assert card is not None
-            logger.debug(f"Retrieved card with hash {hash_str}: {card.content}")
+            logger.debug(f"Created new card with hash: {card.hash}")
+            return card.hash
+
+        # Issue the independent creations concurrently
+        created_hashes = list(await asyncio.gather(*(create_or_reuse(c) for c in test_contents)))
+
+        # Verify cards were created with one query and a set difference
+        placeholders = ", ".join("?" for _ in created_hashes)
+        async with db.execute(
+            f"SELECT hash FROM card WHERE hash IN ({placeholders})", created_hashes
+        ) as cursor:
+            db_hashes = {row[0] for row in await cursor.fetchall()}
+        missing = set(created_hashes) - db_hashes
+        assert not missing, f"Cards not found in database: {missing}"
 
         # List all cards and verify
         all_cards = await test_api.list_cards(page=1, page_size=10)
         assert all_cards is not None
         assert len(all_cards) >= len(test_contents)
         
-        # Verify content matches
-        card_contents = [card.content for card in all_cards]
-        for content in test_contents:
-            assert content in card_contents, f"Content '{content}' not found in card contents"
+        # Verify the listed cards by hash; each hash is derived from its content
+        listed_missing = set(created_hashes) - {card.hash for card in all_cards}
+        assert not listed_missing, f"Cards not found in listing: {listed_missing}"
 
-        # Verify database contents
-        async with db.execute("SELECT hash, content FROM card") as cursor:
-            db_cards = await cursor.fetchall()
-            
-            logger.debug("\nDatabase Contents:")
-            for db_hash, db_content in db_cards:
-                logger.debug(f"Hash: {db_hash}, Content: {db_content}")
-                if db_content in test_contents:
-                    logger.debug(f"Found matching content in database: {db_content}")
-            
-            # Verify all test contents exist in database
-            db_contents = [card[1] for card in db_cards]
-            for content in test_contents:
-                assert content in db_contents, f"Content '{content}' not found in database"
+        # Verify database contents, fetching only the rows under test
+        async with db.execute("SELECT COUNT(*) FROM card") as cursor:
+            (total,) = await cursor.fetchone()
+            logger.debug(f"Database holds {total} cards")
+
+        placeholders = ", ".join("?" for _ in test_contents)
+        async with db.execute(
+            f"SELECT content FROM card WHERE content IN ({placeholders})", test_contents
+        ) as cursor:
+            db_contents = {row[0] for row in await cursor.fetchall()}
+
+        # Verify all test contents exist in database
+        for content in test_contents:
+            assert content in db_contents, f"Content '{content}' not found in database"
 
     finally:
         # Clean up database connection
@@ -3,12 +3,14 @@ import os
 import sys
 import pytest
 import pytest_asyncio
+import httpx
 from pathlib import Path
 
 from mcard.infrastructure.infrastructure_config_manager import get_project_root
 from mcard.infrastructure.persistence.database_engine_config import SQLiteConfig
 from mcard.infrastructure.persistence.store import SQLiteStore
 from mcard.domain.services.hashing import DefaultHashingService, HashingSettings
+from mcard.interfaces.api.mcard_api import app, api
 
 # Configure asyncio for pytest
 def pytest_configure(config):
@@ -17,26 +19,28 @@ def pytest_configure(config):
         "markers", "async_test: mark a test as an async test"
     )
     
-    # Set asyncio policy to use ProactorEventLoop on Windows, SelectorEventLoop on Unix
+    # Set asyncio policy to use ProactorEventLoop on Windows; on Unix prefer
+    # uvloop when it is installed, falling back to the SelectorEventLoop
     if sys.platform.startswith('win'):
         asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
     else:
-        asyncio.set_event_loop_policy(asyncio.DefaultEventLoopPolicy())
+        try:
+            import uvloop
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        except ImportError:
+            asyncio.set_event_loop_policy(asyncio.DefaultEventLoopPolicy())
 
 def pytest_collection_modifyitems(config, items):
-    """Modify test items to support async tests."""
+    """Run every async test on the session-scoped event loop.
+
+    The marker is prepended so it takes precedence over a bare
+    ``@pytest.mark.asyncio`` on the test, letting session-scoped async
+    fixtures share the loop the tests run on.
+    """
+    session_marker = pytest.mark.asyncio(loop_scope="session")
     for item in items:
         if hasattr(item, "obj") and asyncio.iscoroutinefunction(item.obj):
-            item.add_marker(pytest.mark.asyncio)
-
-@pytest.fixture(scope="session")
-def event_loop(request):
-    """Create an event loop for async tests."""
-    policy = asyncio.get_event_loop_policy()
-    loop = policy.new_event_loop()
-    policy.set_event_loop(loop)
-    yield loop
-    loop.close()
+            item.add_marker(session_marker, append=False)
 
 @pytest_asyncio.fixture(scope="function")
 async def default_service():
@@ -45,15 +49,37 @@ async def default_service():
     service = DefaultHashingService(settings)
     return service
 
+@pytest_asyncio.fixture(scope="session")
+async def schema_template():
+    """Build the schema once into an in-memory template database."""
+    template = SQLiteStore(SQLiteConfig(db_path=":memory:"))
+    await template.initialize()
+    yield template
+    await template.close()
+
 @pytest_asyncio.fixture(scope="function")
-async def async_repository():
+async def async_repository(schema_template):
     """Create a repository with a temporary in-memory database."""
     config = SQLiteConfig(db_path=":memory:")
     repo = SQLiteStore(config)
-    await repo.initialize()
+    await repo.initialize_from(schema_template)
     yield repo
     await repo.close()
 
+@pytest_asyncio.fixture(scope="session")
+async def async_client():
+    """Create one HTTP client for the MCard API shared by the whole session.
+
+    ``ASGITransport`` calls the app in-process: it never runs the lifespan
+    startup/shutdown events and keeps no connection pool, so there is no
+    keep-alive state to tune or tear down between tests. Because the
+    shutdown event never fires, the API's store is closed here instead.
+    """
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        yield client
+    await api.shutdown()
+
 @pytest_asyncio.fixture(scope="function")
 async def repository(async_repository):
     """Yield the async repository for tests."""
@@ -66,32 +92,6 @@ async def db_path():
     test_data_dir.mkdir(parents=True, exist_ok=True)
     db_path = test_data_dir / f"test_mcard_{os.getpid()}.db"
     yield str(db_path)
-    # Clean up the database file after the test
-    try:
-        os.unlink(db_path)
-    except FileNotFoundError:
-        pass
-
-# Add a custom marker for async tests
-def pytest_configure(config):
-    """Add custom markers for pytest."""
-    config.addinivalue_line(
-        "markers", "async_test: mark a test as an async test"
-    )
-
-# Monkey patch to handle coroutines in tests
-def pytest_pyfunc_call(pyfuncitem):
-    """Monkey patch to handle coroutine functions in pytest."""
-    if asyncio.iscoroutinefunction(pyfuncitem.obj):
-        # Get the event loop
-        event_loop = asyncio.get_event_loop()
-        
-        # Run the coroutine
-        try:
-            result = event_loop.run_until_complete(pyfuncitem.obj(*pyfuncitem.funcargs.values()))
-            return True
-        except Exception as e:
-            # Re-raise the exception
-            raise e
-    
-    return False
+    # Clean up the database file and its WAL sidecars after the test
+    for suffix in ("", "-wal", "-shm"):
+        Path(f"{db_path}{suffix}").unlink(missing_ok=True)
@@ -122,6 +122,17 @@ def test_is_binary_content_binary():
     content = bytes(range(256))  # Create binary content
     assert interpreter.is_binary_content(content)
 
+@pytest.mark.parametrize("content, expected", [
+    (b'{"key": "value"}\x00', True),
+    (b'<root>\x00</root>', True),
+    (b'a' * 2048 + b'\x00', False),
+    ('café au lait, naïve'.encode('utf-8'), False),
+    ('éèê'.encode('utf-8'), True),
+])
+def test_is_binary_content_sample(content, expected):
+    """Test binary detection only samples the leading 1024 bytes."""
+    assert ContentTypeInterpreter.is_binary_content(content) is expected
+
 def test_detect_pdf_content():
     """Test PDF content detection."""
     interpreter = ContentTypeInterpreter()
@@ -146,6 +157,23 @@ def test_detect_gif_content():
     assert mime_type == 'image/gif'
     assert ext == 'gif'
 
+@pytest.mark.parametrize("content", [
+    *(signature + b'payload' for signature in ContentTypeInterpreter.SIGNATURES),
+    b'\x00\x00\x03\x00',
+    b'\xff\xd8',
+    b'PK\x05\x06',
+    b'\x80\x81\x82',
+    b'',
+])
+def test_signature_lookup_matches_linear_scan(content):
+    """Test lead-byte signature lookup agrees with scanning every signature."""
+    expected = next(
+        (mime_type for signature, mime_type in ContentTypeInterpreter.SIGNATURES.items()
+         if content.startswith(signature)),
+        None,
+    )
+    assert ContentTypeInterpreter._match_signature(content) == expected
+
 def test_malformed_xml_content():
     """Test handling of malformed XML content."""
     interpreter = ContentTypeInterpreter()
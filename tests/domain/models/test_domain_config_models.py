@@ -68,13 +68,13 @@ def test_hashing_settings_validation():
         HashingSettings(parallel_algorithms=["sha256", "invalid"])
 
     # Test custom hash without module/function
-    with pytest.raises(ValueError, match="Custom hash requires both module and function"):
+    with pytest.raises(ValueError, match="Custom module and function must be specified"):
         HashingSettings(algorithm="custom")
 
     # Test custom hash with only module
-    with pytest.raises(ValueError, match="Custom hash requires both module and function"):
+    with pytest.raises(ValueError, match="Custom module and function must be specified"):
         HashingSettings(algorithm="custom", custom_module="my_module")
 
     # Test custom hash with only function
-    with pytest.raises(ValueError, match="Custom hash requires both module and function"):
+    with pytest.raises(ValueError, match="Custom module and function must be specified"):
         HashingSettings(algorithm="custom", custom_function="my_function")
@@ -3,6 +3,7 @@ import os
 import pytest
 import logging
 import tempfile
+import dotenv
 from pathlib import Path
 from mcard.domain.models.domain_config_models import AppSettings, DatabaseSettings, HashingSettings
 
@@ -35,10 +36,11 @@ MCARD_MANAGER_HASH_ALGORITHM=sha256
     os.unlink(temp_path)
 
 @pytest.mark.asyncio
-async def test_config_env_loading(temp_env_file):
+async def test_config_env_loading(temp_env_file, monkeypatch):
     """Test configuration loading from environment variables."""
-    # Load environment variables from temp file
-    dotenv.load_dotenv(temp_env_file, override=True)
+    # Load environment variables from temp file; monkeypatch undoes them after the test
+    for key, value in dotenv.dotenv_values(temp_env_file).items():
+        monkeypatch.setenv(key, value)
     
     # Verify environment variables are loaded
     assert os.getenv('MCARD_API_KEY') == 'test_custom_api_key_12345'
@@ -6,9 +6,9 @@ from datetime import datetime, timedelta
 from typing import Optional, List, Union, Any
 from unittest.mock import Mock
 
-from mcard.domain.models.protocols import HashingService, ContentTypeService
+from mcard.domain.models.protocols import HashingService, ContentTypeService, CardRepository
 from mcard.domain.models.card import MCard
-from mcard.domain.services.hashing import DefaultHashingService
+from mcard.domain.services.hashing import DefaultHashingService, HashingSettings
 
 class MockHashingService(DefaultHashingService):
     """Mock implementation of HashingService protocol."""
@@ -62,6 +62,9 @@ class MockCardRepository:
             cards = cards[:limit]
         return cards
 
+    async def search(self, query: str) -> List[MCard]:
+        return [card for card in self.cards.values() if query in card.hash]
+
     async def get_by_time_range(
         self,
         start_time: Optional[datetime] = None,
@@ -146,7 +149,7 @@ class MockContentTypeService:
 @pytest.mark.asyncio
 async def test_hashing_service_protocol():
     """Test that HashingService protocol can be implemented."""
-    service = MockHashingService()
+    service = MockHashingService(HashingSettings())
     
     # Test protocol implementation
     assert isinstance(service, HashingService)
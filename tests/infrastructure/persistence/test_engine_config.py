@@ -34,18 +34,64 @@ def test_sqlite_config_custom():
     assert config.max_content_size == 10 * 1024 * 1024
     assert config.engine_options == {"check_same_thread": True}
 
+def test_sqlite_config_pragmas():
+    """Test SQLiteConfig extra PRAGMAs."""
+    assert SQLiteConfig(db_path=":memory:").pragmas == {}
+
+    pragmas = {"synchronous": "OFF", "journal_mode": "MEMORY"}
+    config = SQLiteConfig(db_path=":memory:", pragmas=pragmas)
+    assert config.pragmas == pragmas
+    assert config.engine_options == {"check_same_thread": False, "pragmas": pragmas}
+
+    config = create_engine_config(
+        engine_type=EngineType.SQLITE,
+        connection_string=":memory:",
+        engine_options={"pragmas": pragmas}
+    )
+    assert config.pragmas == pragmas
+
+@pytest.mark.parametrize("pragmas", [
+    {"synchronous; DROP TABLE card": "OFF"},
+    {"Synchronous": "OFF"},
+    {"synchronous": "OFF; DROP TABLE card"},
+    {"cache_size": "-2000 "},
+    {"journal_mode": "'MEMORY'"},
+    {"synchronous": "OFF\n"},
+])
+def test_sqlite_config_rejects_unsafe_pragmas(pragmas):
+    """Test that PRAGMA names and values which could inject SQL are rejected."""
+    with pytest.raises(ValueError, match="PRAGMA"):
+        SQLiteConfig(db_path=":memory:", pragmas=pragmas)
+
+def test_sqlite_config_accepts_int_pragmas():
+    """Test that integer PRAGMA values pass validation."""
+    pragmas = {"cache_size": -2000, "busy_timeout": 100}
+    assert SQLiteConfig(db_path=":memory:", pragmas=pragmas).pragmas == pragmas
+
+@pytest.mark.parametrize("db_path, uri, expected", [
+    (":memory:", False, True),
+    ("file::memory:?cache=shared", True, True),
+    ("file:shared_db?mode=memory&cache=shared", True, True),
+    ("file:data/test.db?mode=ro", True, False),
+    ("data/test.db", False, False),
+    ("file::memory:?cache=shared", False, False),
+])
+def test_sqlite_config_is_memory(db_path, uri, expected):
+    """Test in-memory detection for plain paths and SQLite URIs."""
+    assert SQLiteConfig(db_path=db_path, uri=uri).is_memory is expected
+
 def test_sqlite_config_validation():
     """Test SQLiteConfig validation."""
     # Test invalid max_connections
-    with pytest.raises(ValueError, match="max_connections must be positive"):
+    with pytest.raises(ValueError, match="Maximum connections must be positive"):
         SQLiteConfig(db_path=":memory:", max_connections=0)
 
     # Test invalid timeout
-    with pytest.raises(ValueError, match="timeout must be positive"):
+    with pytest.raises(ValueError, match="Timeout must be non-negative"):
         SQLiteConfig(db_path=":memory:", timeout=-1.0)
 
     # Test invalid max_content_size
-    with pytest.raises(ValueError, match="max_content_size must be positive"):
+    with pytest.raises(ValueError, match="Maximum content size must be positive"):
         SQLiteConfig(db_path=":memory:", max_content_size=0)
 
 def test_create_engine_config():
@@ -0,0 +1,55 @@
+"""Tests for the SQLite card schema."""
+import pytest
+import pytest_asyncio
+import aiosqlite
+from mcard.infrastructure.persistence.engine.sqlite_engine import SQLiteStore
+from mcard.infrastructure.persistence.database_engine_config import SQLiteConfig
+
+CARD_INDEXES_SQL = "SELECT name FROM sqlite_master WHERE type = 'index' AND tbl_name = 'card'"
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path to a fresh database file."""
+    return str(tmp_path / "schema.db")
+
+@pytest_asyncio.fixture
+async def repository(db_path):
+    """SQLite store with the default connection settings."""
+    repo = SQLiteStore(SQLiteConfig(db_path=db_path))
+    await repo.initialize()
+    yield repo
+    await repo.close()
+
+@pytest.mark.asyncio
+async def test_hash_lookup_uses_unique_index(repository, db_path):
+    """Test hash lookups are served by the index behind the UNIQUE constraint."""
+    async with aiosqlite.connect(db_path) as connection:
+        async with connection.execute(CARD_INDEXES_SQL) as cursor:
+            index_names = {row[0] for row in await cursor.fetchall()}
+        assert 'idx_card_hash' not in index_names  # Would duplicate the UNIQUE index
+
+        async with connection.execute(
+            "EXPLAIN QUERY PLAN SELECT content, g_time FROM card WHERE hash = ?", ("x",)
+        ) as cursor:
+            plan = " ".join(row[-1] for row in await cursor.fetchall())
+    assert "sqlite_autoindex_card" in plan
+
+@pytest.mark.asyncio
+async def test_initialize_drops_retired_hash_index(db_path):
+    """Test databases created with idx_card_hash lose it on initialization."""
+    async with aiosqlite.connect(db_path) as connection:
+        await connection.executescript(
+            "CREATE TABLE card (id INTEGER PRIMARY KEY AUTOINCREMENT, hash TEXT NOT NULL UNIQUE, "
+            "content TEXT NOT NULL, g_time TEXT NOT NULL);"
+            "CREATE INDEX idx_card_hash ON card (hash);"
+        )
+
+    repo = SQLiteStore(SQLiteConfig(db_path=db_path))
+    await repo.initialize()
+    await repo.close()
+
+    async with aiosqlite.connect(db_path) as connection:
+        async with connection.execute(CARD_INDEXES_SQL) as cursor:
+            index_names = {row[0] for row in await cursor.fetchall()}
+    assert 'idx_card_hash' not in index_names
+    assert 'idx_card_g_time' in index_names
@@ -1,13 +1,15 @@
 """Tests for performance characteristics of SQLite card repository."""
 import pytest
+import pytest_asyncio
+import asyncio
 import tempfile
 import os
 import time
-import concurrent.futures
 from datetime import datetime, timezone
-from mcard.infrastructure.persistence.engine.sqlite_engine import SQLiteStore
+from mcard.infrastructure.persistence.engine.sqlite_engine import SQLiteStore, SAVE_MANY_BATCH_ROWS
 from mcard.infrastructure.persistence.database_engine_config import SQLiteConfig, EngineConfig, EngineType
 from mcard.domain.models.card import MCard
+from mcard.domain.models.exceptions import StorageError
 import logging
 
 # Configure logging
@@ -16,6 +18,14 @@ logging.basicConfig(
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 
+# Benchmark databases are throwaway, so trade durability for write speed
+FAST_PRAGMAS = {
+    'journal_mode': 'MEMORY',
+    'synchronous': 'OFF',
+    'temp_store': 'MEMORY',
+    'locking_mode': 'EXCLUSIVE',
+}
+
 @pytest.fixture
 def db_path():
     """Create a temporary database file."""
@@ -24,116 +34,157 @@ def db_path():
     os.close(fd)
     os.unlink(path)
 
-@pytest.fixture
-def repository(db_path):
+@pytest_asyncio.fixture
+async def repository(db_path):
     """Fixture for SQLite repository."""
-    repo = SQLiteStore(SQLiteConfig(db_path=db_path))
+    repo = SQLiteStore(SQLiteConfig(db_path=db_path, pragmas=FAST_PRAGMAS))
     yield repo
+    await repo.close()
 
-def test_write_performance(repository):
+@pytest.mark.asyncio
+async def test_write_performance(repository):
     """Test write performance."""
     start_time = time.time()
     num_cards = 1000
     
     for i in range(num_cards):
         card = MCard(content=f"Content {i}")
-        repository.save(card)
+        await repository.save(card)
     
     duration = time.time() - start_time
     logging.info(f"Wrote {num_cards} cards in {duration:.2f} seconds")
     assert duration < 10  # Should complete within 10 seconds
 
-def test_read_performance(repository):
+@pytest.mark.asyncio
+async def test_read_performance(repository):
     """Test read performance."""
     # Create test data
     cards = []
     for i in range(1000):
         card = MCard(content=f"Content {i}")
-        repository.save(card)
+        await repository.save(card)
         cards.append(card)
     
     # Test read performance
     start_time = time.time()
     for card in cards:
-        retrieved = repository.get(card.hash)
+        retrieved = await repository.get(card.hash)
         assert retrieved is not None
     
     duration = time.time() - start_time
     logging.info(f"Read {len(cards)} cards in {duration:.2f} seconds")
     assert duration < 10  # Should complete within 10 seconds
 
-def test_batch_performance(repository):
+@pytest.mark.asyncio
+async def test_batch_performance(repository):
     """Test batch operation performance."""
     # Create test data
     num_cards = 1000
-    cards = [MCard(content=f"Content {i}") for i in range(num_cards)]
+    contents = [f"Content {i}" for i in range(num_cards)]
     
     # Test batch save
     start_time = time.time()
-    repository.save_many(cards)
+    cards = await repository.create_many(contents)
     save_duration = time.time() - start_time
     logging.info(f"Batch saved {num_cards} cards in {save_duration:.2f} seconds")
     
     # Test batch get
     start_time = time.time()
     hashes = [card.hash for card in cards]
-    retrieved_cards = repository.get_many(hashes)
+    retrieved_cards = await asyncio.gather(*(repository.get(h) for h in hashes))
     get_duration = time.time() - start_time
     logging.info(f"Batch retrieved {len(retrieved_cards)} cards in {get_duration:.2f} seconds")
     
+    assert all(card is not None for card in retrieved_cards)
     assert save_duration < 5  # Should complete within 5 seconds
     assert get_duration < 5  # Should complete within 5 seconds
 
-def test_concurrent_performance(repository):
+@pytest.mark.asyncio
+async def test_save_many_performance(repository):
+    """Test saving a batch of existing cards in one commit."""
+    num_cards = 1000
+    cards = [MCard(content=f"Content {i}") for i in range(num_cards)]
+
+    start_time = time.time()
+    await repository.save_many(cards)
+    duration = time.time() - start_time
+    logging.info(f"Saved {num_cards} cards with save_many in {duration:.2f} seconds")
+
+    assert await repository.get_total_count() == num_cards
+    assert duration < 5  # Should complete within 5 seconds
+
+@pytest.mark.asyncio
+async def test_save_many_rollback(repository):
+    """Test a failing batch save leaves none of its cards behind."""
+    existing = MCard(content="Existing content")
+    await repository.save(existing)
+
+    # The duplicate sits past the first INSERT statement, so the rows that
+    # statement wrote are only discarded by the transaction rollback
+    batch = [MCard(content=f"Batch content {i}") for i in range(SAVE_MANY_BATCH_ROWS + 1)]
+    batch.append(MCard(content="Existing content"))  # Duplicate hash fails the batch
+
+    with pytest.raises(StorageError):
+        await repository.save_many(batch)
+
+    # A later save commits; the failed batch must not ride along with it
+    await repository.save(MCard(content="After the batch"))
+    for card in batch[:-1]:
+        assert await repository.get(card.hash) is None
+    assert (await repository.get(existing.hash)).content == "Existing content"
+
+@pytest.mark.asyncio
+async def test_concurrent_performance(repository):
     """Test concurrent operation performance."""
     num_threads = 4
     cards_per_thread = 250
     
-    def worker(start_idx):
+    async def worker(start_idx):
         for i in range(start_idx, start_idx + cards_per_thread):
             card = MCard(content=f"Content {i}")
-            repository.save(card)
-            retrieved = repository.get(card.hash)
+            await repository.save(card)
+            retrieved = await repository.get(card.hash)
             assert retrieved is not None
     
     start_time = time.time()
-    with concurrent.futures.ThreadPoolExecutor(max_workers=num_threads) as executor:
-        futures = [executor.submit(worker, i * cards_per_thread) for i in range(num_threads)]
-        concurrent.futures.wait(futures)
+    await asyncio.gather(*(worker(i * cards_per_thread) for i in range(num_threads)))
     
     duration = time.time() - start_time
     total_operations = num_threads * cards_per_thread * 2  # save + get
     logging.info(f"Completed {total_operations} concurrent operations in {duration:.2f} seconds")
     assert duration < 20  # Should complete within 20 seconds
 
-def test_query_performance(repository):
+@pytest.mark.asyncio
+async def test_query_performance(repository):
     """Test query performance."""
     # Create test data
     num_cards = 1000
     for i in range(num_cards):
         card = MCard(content=f"Content {i}")
-        repository.save(card)
+        await repository.save(card)
     
-    # Test get_all performance
+    # Test listing performance
     start_time = time.time()
-    all_cards = repository.get_all()
+    all_cards, _ = await repository.list()
     duration = time.time() - start_time
     logging.info(f"Retrieved {len(all_cards)} cards in {duration:.2f} seconds")
+    assert len(all_cards) == num_cards
     assert duration < 5  # Should complete within 5 seconds
 
-def test_delete_performance(repository):
+@pytest.mark.asyncio
+async def test_delete_performance(repository):
     """Test delete performance."""
     # Create test data
     cards = []
     for i in range(1000):
         card = MCard(content=f"Content {i}")
-        repository.save(card)
+        await repository.save(card)
         cards.append(card)
     
     # Test delete performance
     start_time = time.time()
     for card in cards:
-        repository.delete(card.hash)
+        await repository.remove(card.hash)
     
     duration = time.time() - start_time
     logging.info(f"Deleted {len(cards)} cards in {duration:.2f} seconds")
@@ -0,0 +1,33 @@
+"""Tests for the MCard API configuration loader."""
+import pytest
+
+from mcard.config_constants import ENV_API_PORT
+from mcard.interfaces.api.api_config_loader import get_settings
+
+
+@pytest.fixture(autouse=True)
+def fresh_settings():
+    """Start and finish each test with an empty settings cache."""
+    get_settings.cache_clear()
+    yield
+    get_settings.cache_clear()
+
+
+def test_get_settings_is_cached(monkeypatch):
+    """Test that settings are loaded once and reused."""
+    monkeypatch.setenv(ENV_API_PORT, "5400")
+    settings = get_settings()
+
+    monkeypatch.setenv(ENV_API_PORT, "5401")
+    assert get_settings() is settings
+    assert get_settings().mcard_api_port == 5400
+
+
+def test_get_settings_cache_clear_reloads(monkeypatch):
+    """Test that clearing the cache picks up environment changes."""
+    monkeypatch.setenv(ENV_API_PORT, "5400")
+    assert get_settings().mcard_api_port == 5400
+
+    monkeypatch.setenv(ENV_API_PORT, "5401")
+    get_settings.cache_clear()
+    assert get_settings().mcard_api_port == 5401
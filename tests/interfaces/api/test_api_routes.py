@@ -0,0 +1,61 @@
+"""Test MCard API route wiring."""
+import os
+import pytest
+from unittest.mock import AsyncMock
+from mcard.domain.models.card import MCard
+from mcard.interfaces.api.mcard_api import api
+from mcard.interfaces.api.api_config_loader import get_settings
+from mcard.config_constants import DEFAULT_API_KEY, ENV_API_KEY
+
+HEADERS = {"x-api-key": os.getenv(ENV_API_KEY, DEFAULT_API_KEY)}
+
+@pytest.mark.asyncio
+async def test_missing_api_key_is_rejected(async_client):
+    """Test a request without an API key gets a 401."""
+    response = await async_client.get("/cards/missing")
+    assert response.status_code == 401
+
+@pytest.mark.asyncio
+async def test_wrong_api_key_is_rejected(async_client):
+    """Test a wrong API key is checked against the settings and gets a 403."""
+    response = await async_client.get("/cards/missing", headers={"x-api-key": "wrong-key"})
+    assert response.status_code == 403
+
+@pytest.mark.asyncio
+async def test_create_card_body_is_only_the_card(async_client, monkeypatch):
+    """Test POST /cards takes the card as its whole body and returns it."""
+    card = MCard(content="Route content")
+    monkeypatch.setattr(api, "create_card", AsyncMock(return_value=card))
+    response = await async_client.post("/cards", json={"content": "Route content"}, headers=HEADERS)
+    assert response.status_code == 200
+    assert response.json()["hash"] == card.hash
+
+@pytest.mark.asyncio
+async def test_get_card_returns_card_response(async_client, monkeypatch):
+    """Test GET /cards/{hash} returns the card as a CardResponse."""
+    card = MCard(content="Route content")
+    monkeypatch.setattr(api, "get_card", AsyncMock(return_value=card))
+    response = await async_client.get(f"/cards/{card.hash}", headers=HEADERS)
+    assert response.status_code == 200
+    assert response.json()["hash"] == card.hash
+    assert response.json()["content"] == "Route content"
+
+@pytest.mark.asyncio
+async def test_list_cards_returns_card_responses(async_client, monkeypatch):
+    """Test GET /cards returns the page of cards as CardResponse items."""
+    card = MCard(content="Route content")
+    monkeypatch.setattr(api, "list_cards", AsyncMock(return_value=[card]))
+    response = await async_client.get("/cards?page=1&page_size=10", headers=HEADERS)
+    assert response.status_code == 200
+    assert [item["hash"] for item in response.json()["items"]] == [card.hash]
+
+@pytest.mark.asyncio
+async def test_shutdown_drops_provisioning_app():
+    """Test shutdown drops the provisioning app that holds the closed store."""
+    api.card_provisioning_app = object()
+    await api.shutdown()
+    assert not hasattr(api, "card_provisioning_app")
+
+def test_settings_carry_the_api_key():
+    """Test the cached settings carry the API key the requests send."""
+    assert get_settings().mcard_api_key == HEADERS["x-api-key"]
@@ -1,38 +1,39 @@
-"""Test MCard API persistent storage."""
-import os
+"""Test MCard API storage across in-memory and on-disk backends."""
 import pytest
 import pytest_asyncio
-import tempfile
-from fastapi.testclient import TestClient
-from pathlib import Path
-from mcard.domain.models.card import MCard
 from mcard.interfaces.api.mcard_api import MCardAPI
-from mcard.infrastructure.persistence.database_engine_config import SQLiteConfig
-from mcard.interfaces.api.async_api_wrapper import AsyncAPIWrapper
-from mcard.infrastructure.persistence.async_persistence_wrapper import AsyncPersistenceWrapper as PersistenceWrapper
-
-@pytest.fixture
-def db_path():
-    """Create a temporary database file."""
-    temp_path = tempfile.mktemp()
-    yield temp_path
-    if os.path.exists(temp_path):
-        os.unlink(temp_path)
-
-@pytest_asyncio.fixture
-async def async_repository(db_path):
-    """Create a repository with the temporary database."""
-    persistence = PersistenceWrapper(SQLiteConfig(db_path=db_path))
-    wrapper = AsyncAPIWrapper(persistence)
-    async with wrapper as repo:
-        yield repo
+from mcard.interfaces.api.api_config_loader import get_settings
+from mcard.config_constants import ENV_DB_PATH
+
+@pytest.fixture(scope="module", params=["memory", "file"])
+def db_path(request, tmp_path_factory):
+    """Name the database for each storage backend under test.
+
+    ``memory`` is a private ``:memory:`` database; ``file`` is an on-disk
+    database in a temporary directory, which is how the API persists cards.
+    """
+    if request.param == "memory":
+        return ":memory:"
+    return str(tmp_path_factory.mktemp("api") / "test_mcard.db")
+
+@pytest_asyncio.fixture(scope="module")
+async def api(db_path):
+    """Point the API singleton's store at the backend under test."""
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(ENV_DB_PATH, db_path)
+        get_settings.cache_clear()
+        instance = MCardAPI()
+        # Drop any store opened with earlier settings so the next call uses db_path
+        await instance.shutdown()
+        yield instance
+        await instance.shutdown()
+    get_settings.cache_clear()
 
 @pytest.mark.asyncio
-async def test_mcard_api_persistent(async_repository):
-    """Test MCard API with persistent storage."""
-    # Initialize API with repository
-    api = MCardAPI(repository=async_repository)
-    assert api.repository is not None  # Verify repository is properly set
+async def test_mcard_api_persistent(api, db_path):
+    """Test MCard API CRUD round trip against each storage backend."""
+    store = await api.get_store()
+    assert store.store._config.db_path == db_path
 
     # Test creating a card
     content = "Test content"
@@ -41,6 +42,7 @@ async def test_mcard_api_persistent(async_repository):
 
     # Test getting a card
     retrieved = await api.get_card(card.hash)
+    assert retrieved is not None
     assert retrieved.content == content
 
     # Test listing cards
@@ -1,13 +1,13 @@
 """
 Tests for the MCard CLI interface.
 """
+import asyncio
 import pytest
 from datetime import datetime, timezone
 from click.testing import CliRunner
-from unittest.mock import AsyncMock, patch, MagicMock
+from unittest.mock import patch
 
 from mcard.domain.models.card import MCard
-from mcard.infrastructure.persistence.engine.sqlite_engine import SQLiteStore
 from mcard.interfaces.cli.commands import cli
 
 # Test data
@@ -16,41 +16,79 @@ TEST_HASH = "test_hash_123"
 TEST_TIME = datetime.now(timezone.utc).isoformat()
 TEST_CARD = MCard(content=TEST_CONTENT, hash=TEST_HASH, g_time=TEST_TIME)
 
-@pytest.fixture
+class StubRepo:
+    """Hand-written repository stub that records every call it receives."""
+
+    def __init__(self):
+        self.calls = []
+        self.saved = []
+        self.card = None
+        self.cards = []
+
+    async def save(self, card):
+        self.calls.append(("save", card))
+        self.saved.append(card)
+
+    async def get(self, hash_str):
+        self.calls.append(("get", hash_str))
+        return self.card
+
+    async def get_all(self, limit=None, offset=None):
+        self.calls.append(("get_all", limit, offset))
+        return self.cards
+
+    async def get_by_time_range(self, start_time=None, end_time=None, limit=None, offset=None):
+        self.calls.append(("get_by_time_range", start_time, end_time, limit, offset))
+        return self.cards
+
+@pytest.fixture(autouse=True)
+def keep_event_loop():
+    """Restore the current event loop, which the CLI's asyncio.run() clears on exit.
+
+    Async tests later on the same worker share a session-scoped loop and fail
+    with "no current event loop" if it is left unset.
+    """
+    policy = asyncio.get_event_loop_policy()
+    try:
+        loop = policy.get_event_loop()
+    except RuntimeError:
+        loop = None
+    yield
+    policy.set_event_loop(loop)
+
+@pytest.fixture(scope="session")
 def runner():
-    """Create a CLI test runner."""
+    """Create a CLI test runner shared by all tests."""
     return CliRunner()
 
 @pytest.fixture
-def mock_repo():
-    """Create a mock repository."""
-    repo = AsyncMock()
-    repo.save = AsyncMock()
-    repo.get = AsyncMock()
-    repo.get_all = AsyncMock()
-    repo.get_by_time_range = AsyncMock()
-    return repo
+def stub_repo():
+    """Create a fresh repository stub."""
+    return StubRepo()
 
 @pytest.fixture
-def mock_get_repo(mock_repo):
-    """Mock the get_repository function."""
-    with patch('mcard.interfaces.cli.commands.get_repository', return_value=mock_repo):
-        yield mock_repo
+def mock_get_repo(stub_repo):
+    """Point the CLI's get_repository at the stub."""
+    async def get_repository():
+        return stub_repo
+
+    with patch('mcard.interfaces.cli.commands.get_repository', get_repository):
+        yield stub_repo
 
 def test_create_command(runner, mock_get_repo):
     """Test the create command."""
-    mock_get_repo.save.return_value = None
     result = runner.invoke(cli, ['create', TEST_CONTENT])
     
     assert result.exit_code == 0
     assert "Created card with hash:" in result.output
     assert "Global time:" in result.output
     
-    mock_get_repo.save.assert_called_once()
+    assert [name for name, *_ in mock_get_repo.calls] == ["save"]
+    assert mock_get_repo.saved[0].content == TEST_CONTENT
 
 def test_get_command_success(runner, mock_get_repo):
     """Test the get command with an existing card."""
-    mock_get_repo.get.return_value = TEST_CARD
+    mock_get_repo.card = TEST_CARD
     result = runner.invoke(cli, ['get', TEST_HASH])
     
     assert result.exit_code == 0
@@ -58,51 +96,40 @@ def test_get_command_success(runner, mock_get_repo):
     assert TEST_CONTENT in result.output
     assert TEST_TIME in result.output
     
-    mock_get_repo.get.assert_called_once_with(TEST_HASH)
+    assert mock_get_repo.calls == [("get", TEST_HASH)]
 
 def test_get_command_not_found(runner, mock_get_repo):
     """Test the get command with a non-existent card."""
-    mock_get_repo.get.return_value = None
+    mock_get_repo.card = None
     result = runner.invoke(cli, ['get', TEST_HASH])
     
     assert result.exit_code == 0
     assert "Card not found" in result.output
     
-    mock_get_repo.get.assert_called_once_with(TEST_HASH)
+    assert mock_get_repo.calls == [("get", TEST_HASH)]
 
-def test_list_command_no_filters(runner, mock_get_repo):
-    """Test the list command without filters."""
-    mock_get_repo.get_all.return_value = [TEST_CARD]
-    result = runner.invoke(cli, ['list'])
+@pytest.mark.parametrize("args, expected_call", [
+    ([], ("get_all", None, None)),
+    (
+        ["--start-time", "2024-01-01T00:00:00Z", "--end-time", "2024-01-02T00:00:00Z"],
+        ("get_by_time_range", datetime(2024, 1, 1), datetime(2024, 1, 2), None, None),
+    ),
+], ids=["no_filters", "with_time_range"])
+def test_list_command(runner, mock_get_repo, args, expected_call):
+    """Test the list command with and without time range filters."""
+    mock_get_repo.cards = [TEST_CARD]
+    result = runner.invoke(cli, ['list', *args])
     
     assert result.exit_code == 0
     assert TEST_HASH in result.output
     assert TEST_CONTENT in result.output
     assert TEST_TIME in result.output
     
-    mock_get_repo.get_all.assert_called_once_with(None, None)
-
-def test_list_command_with_time_range(runner, mock_get_repo):
-    """Test the list command with time range filters."""
-    mock_get_repo.get_by_time_range.return_value = [TEST_CARD]
-    start_time = "2024-01-01T00:00:00Z"
-    end_time = "2024-01-02T00:00:00Z"
-    
-    result = runner.invoke(cli, [
-        'list',
-        '--start-time', start_time,
-        '--end-time', end_time
-    ])
-    
-    assert result.exit_code == 0
-    assert TEST_HASH in result.output
-    assert TEST_CONTENT in result.output
-    
-    mock_get_repo.get_by_time_range.assert_called_once()
+    assert mock_get_repo.calls == [expected_call]
 
 def test_list_command_with_pagination(runner, mock_get_repo):
     """Test the list command with pagination."""
-    mock_get_repo.get_all.return_value = [TEST_CARD]
+    mock_get_repo.cards = [TEST_CARD]
     result = runner.invoke(cli, [
         'list',
         '--limit', '10',
@@ -113,4 +140,4 @@ def test_list_command_with_pagination(runner, mock_get_repo):
     assert TEST_HASH in result.output
     assert TEST_CONTENT in result.output
     
-    mock_get_repo.get_all.assert_called_once_with(10, 0)
+    assert mock_get_repo.calls == [("get_all", 10, 0)]
@@ -1,47 +1,117 @@
+import os
 import pytest
+from fastapi import FastAPI
 from fastapi.testclient import TestClient
+from mcard.interfaces.api import server
 from mcard.interfaces.api.server import app
+from mcard.interfaces.api.mcard_api import api
+from mcard.interfaces.api.api_config_loader import get_settings
+from mcard.config_constants import ENV_DB_PATH, ENV_API_KEY, DEFAULT_API_KEY, CORS_ORIGINS
 
-client = TestClient(app)
+try:
+    import uvloop  # noqa: F401
+    BACKEND_OPTIONS = {"use_uvloop": True}
+except ImportError:
+    BACKEND_OPTIONS = {}
 
-api_key = "your_api_key_here"  # Set your actual API key
+HEADERS = {"x-api-key": os.getenv(ENV_API_KEY, DEFAULT_API_KEY)}
 
 
-def test_server_initialization():
+def copy_app():
+    """Build a FastAPI app serving the API's routes, with no middleware."""
+    return FastAPI(
+        routes=app.routes,
+        on_startup=app.router.on_startup,
+        on_shutdown=app.router.on_shutdown,
+        openapi_url=None,
+    )
+
+
+@pytest.fixture(scope="module")
+def serve(tmp_path_factory):
+    """Yield a function that serves an app against a temporary database.
+
+    Server errors come back as 500 responses instead of being re-raised, and
+    the portal runs on uvloop when it is installed.
+    """
+    db_path = str(tmp_path_factory.mktemp("server") / "test_server.db")
+
+    def make_client(target_app):
+        return TestClient(
+            target_app,
+            raise_server_exceptions=False,
+            backend="asyncio",
+            backend_options=BACKEND_OPTIONS,
+        )
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv(ENV_DB_PATH, db_path)
+        get_settings.cache_clear()
+        yield make_client
+    get_settings.cache_clear()
+
+
+@pytest.fixture(scope="module")
+def client(serve):
+    """Client for the endpoint benchmarks, served without middleware."""
+    with serve(copy_app()) as test_client:
+        # Drop a store opened with earlier settings so requests use the temporary database
+        test_client.portal.call(api.shutdown)
+        yield test_client
+
+
+@pytest.fixture
+def cors_client(serve, monkeypatch):
+    """Client for an app set up by server.configure_app, as main() does."""
+    cors_app = copy_app()
+    monkeypatch.setattr(server, "app", cors_app)
+    server.configure_app()
+    with serve(cors_app) as test_client:
+        yield test_client
+
+
+def test_server_initialization(client):
     """Test if the server initializes without errors."""
-    response = client.get('/health', headers={'Authorization': f'Bearer {api_key}'})  # Test health check endpoint
+    response = client.get('/health', headers=HEADERS)  # Test health check endpoint
     assert response.status_code == 200
 
-    response = client.post('/cards/', json={'content': 'Test card content'}, headers={'Authorization': f'Bearer {api_key}'})  # Test create card
-    assert response.status_code == 201
+    response = client.post('/cards', json={'content': 'Test card content'}, headers=HEADERS)  # Test create card
+    assert response.status_code == 200
     card_hash = response.json()['hash']  # Get the card hash from response
     assert 'hash' in response.json()  # Check for card hash in response
 
-    response = client.get(f'/cards/{card_hash}', headers={'Authorization': f'Bearer {api_key}'})  # Test get card by hash
+    response = client.get(f'/cards/{card_hash}', headers=HEADERS)  # Test get card by hash
     assert response.status_code == 200
 
-    response = client.get('/cards/?page=1&page_size=10', headers={'Authorization': f'Bearer {api_key}'})  # Test list cards
+    response = client.get('/cards?page=1&page_size=10', headers=HEADERS)  # Test list cards
     assert response.status_code == 200
 
-    response = client.delete(f'/cards/{card_hash}', headers={'Authorization': f'Bearer {api_key}'})  # Test remove card by hash
+    response = client.delete(f'/cards/{card_hash}', headers=HEADERS)  # Test remove card by hash
     assert response.status_code == 200
 
-    response = client.delete('/cards/', headers={'Authorization': f'Bearer {api_key}'})  # Test delete all cards
+    response = client.delete('/cards', headers=HEADERS)  # Test delete all cards
     assert response.status_code == 200
 
-    response = client.get('/health', headers={'Authorization': f'Bearer {api_key}'})  # Test health check
+    response = client.get('/health', headers=HEADERS)  # Test health check
     assert response.status_code == 200
 
 
-def test_api_endpoint():
-    """Test a specific API endpoint."""
-    response = client.get('/cards/', headers={'Authorization': f'Bearer {api_key}'})  # Test cards endpoint
-    assert response.status_code == 200
+@pytest.mark.parametrize("method, path, status", [
+    ("GET", "/health", 200),
+    ("GET", "/cards", 200),
+    ("GET", "/cards?page=1&page_size=10", 200),
+])
+def test_api_endpoint(client, method, path, status):
+    """Test read-only API endpoints against the shared client."""
+    response = client.request(method, path, headers=HEADERS)
+    assert response.status_code == status
 
 
-def test_cors():
+def test_cors(cors_client):
     """Test CORS configuration."""
-    response = client.options('/cards/', headers={'Authorization': f'Bearer {api_key}'})  # Test CORS for cards endpoint
+    origin = CORS_ORIGINS[0]
+    preflight = {"Origin": origin, "Access-Control-Request-Method": "GET", **HEADERS}
+    response = cors_client.options('/cards', headers=preflight)  # Test CORS for cards endpoint
     assert response.status_code == 200
     assert "Access-Control-Allow-Origin" in response.headers
-    assert response.headers["Access-Control-Allow-Origin"] == "*"  # Adjust based on your CORS settings
+    assert response.headers["Access-Control-Allow-Origin"] == origin  # Credentialed CORS echoes the allowed origin